@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+The numerical core of the logrank tests: the (weighted) observed minus expected deaths, Z, and its variance, V. This
+code isn't to be called directly.
+
+``multivariate_logrank_test`` uses a numpy kernel for the full covariance matrix. For the two-sample statistics of
+``pairwise_logrank_test``, if numba is installed, each pair is computed in a single fused pass over the ordered times,
+with the pairs in parallel. Otherwise a numpy version is used.
+
+"""
+import numpy as np
+from scipy.linalg.blas import dsyrk
+
+from lifelines.utils import _exclusive_cumsum
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+
+def _compute_Z_and_V(removed, observed, weights):
+    """
+    Parameters
+    ----------
+    removed: (T, G) array
+        the number removed (death or censored) at each ordered time, for each group.
+    observed: (T, G) array
+        the number of observed deaths at each ordered time, for each group.
+    weights: (T,) array
+        the weights applied at each ordered time.
+
+    Returns
+    -------
+    Z: (G,) array
+    V: (G, G) array
+    """
+    G = removed.shape[1]
+
+    n_ij = removed.sum(0) - _exclusive_cumsum(removed)
+    d_i = observed.sum(1)
+    n_i = n_ij.sum(1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ev_i = np.where(n_i[:, None] > 0, n_ij * (d_i / n_i)[:, None], 0)
+        ratio = (n_i - d_i) / (n_i - 1)
+        ratio[~np.isfinite(ratio)] = 1
+        ratio = np.clip(ratio, 0, None)  # possible with case weights, when less than one subject is at risk
+        factor = ratio * d_i / n_i ** 2
+    factor[n_i == 0] = 0
+
+    Z = (weights[:, None] * (observed - ev_i)).sum(0)
+
+    scale = weights * np.sqrt(factor)
+    V_ = n_ij * scale[:, None]  # weighted V_
+
+    # V = diag(V_.T @ (n_i * scale)) - V_.T @ V_, using a symmetric rank-k update for the latter.
+    V = dsyrk(1.0, V_, trans=1, lower=0)
+    V = -(np.triu(V) + np.triu(V, 1).T)
+    ix = np.arange(G)
+    V[ix, ix] += V_.T @ (n_i * scale)
+    return Z, V
+
+
+def _pairwise_Z_and_V_loop(n_ij, observed, ix1, ix2, weighting, p, q):
+    """
+    Parameters
+    ----------
+    n_ij: (T, G) array
+        the number at risk in each group, just prior to each ordered time.
+    observed: (T, G) array
+        the number of observed deaths at each ordered time, for each group.
+    ix1, ix2: (P,) int arrays
+        the groups to compare in each pair.
+    weighting: int
+        the position of the weightings in ``statistics._LOGRANK_WEIGHTINGS``: 0 logrank, 1 Wilcoxon, 2 Tarone-Ware,
+        3 Peto and 4 Fleming-Harrington (with parameters p and q).
+
+    Returns
+    -------
+    Z: (P,) array
+    V: (P,) array
+    """
+    T = n_ij.shape[0]
+    P = ix1.shape[0]
+    Z = np.zeros(P)
+    V = np.zeros(P)
+
+    for k in prange(P):
+        a = ix1[k]
+        b = ix2[k]
+        peto = 1.0
+        s = 1.0  # left-continuous Kaplan-Meier estimate
+        for t in range(T):
+            n_a = n_ij[t, a]
+            n_b = n_ij[t, b]
+            n = n_a + n_b
+            d_a = observed[t, a]
+            d = d_a + observed[t, b]
+
+            if weighting == 0:
+                w = 1.0
+            elif weighting == 1:
+                w = n
+            elif weighting == 2:
+                w = np.sqrt(n)
+            elif weighting == 3:
+                peto *= 1.0 - d / (n + 1)
+                w = peto
+            else:
+                w = s ** p * (1.0 - s) ** q
+
+            if n > 0:
+                ratio = (n - d) / (n - 1) if n != 1 else 1.0
+                ratio = max(ratio, 0.0)  # possible with case weights, when less than one subject is at risk
+                Z[k] += w * (d_a - n_a * d / n)
+                V[k] += w * w * ratio * d / (n * n) * n_a * n_b
+                s *= 1.0 - d / n
+
+    return Z, V
+
+
+if njit is not None:
+    _pairwise_Z_and_V = njit(parallel=True, cache=True)(_pairwise_Z_and_V_loop)
+else:
+    _pairwise_Z_and_V = None
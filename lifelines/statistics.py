@@ -1,30 +1,36 @@
 # -*- coding: utf-8 -*-
 
-from itertools import combinations
+from functools import lru_cache
 import warnings
 
 import numpy as np
-from scipy import stats
+from scipy import special, stats
+from scipy.linalg import cho_factor, cho_solve, LinAlgError
 import pandas as pd
 
 from lifelines import utils
 from lifelines.utils import (
-    group_survival_table_from_events,
     string_rjustify,
     format_p_value,
     format_floats,
     interpolate_at_times_and_return_pandas,
     _expected_value_of_survival_up_to_t,
     _expected_value_of_survival_squared_up_to_t,
+    _exclusive_cumsum,
 )
 
 from lifelines import KaplanMeierFitter
+from lifelines._logrank_numba import _compute_Z_and_V, _pairwise_Z_and_V
+
+# set to True to run extra internal sanity checks in the statistical tests.
+_VALIDATE = False
 
 __all__ = [
     "StatisticalResult",
     "logrank_test",
     "multivariate_logrank_test",
     "pairwise_logrank_test",
+    "LogrankCutoffScanner",
     "survival_difference_at_fixed_point_in_time_test",
     "proportional_hazard_test",
     "power_under_cph",
@@ -160,15 +166,13 @@ class StatisticalResult:
             a DataFrame containing the test statistics and the p-value
 
         """
-        cols = ["test_statistic", "p"]
-
         # test to see if self.names is a tuple
         if self.name and isinstance(self.name[0], tuple):
             index = pd.MultiIndex.from_tuples(self.name)
         else:
             index = self.name
 
-        df = pd.DataFrame(list(zip(self._test_statistic, self._p_value)), columns=cols, index=index).sort_index()
+        df = pd.DataFrame({"test_statistic": self._test_statistic, "p": self._p_value}, index=index).sort_index()
         df["-log2(p)"] = -utils.quiet_log2(df["p"])
         return df
 
@@ -214,6 +218,18 @@ class StatisticalResult:
         return self.to_ascii()
 
 
+@lru_cache(maxsize=1024)
+def _cached_z(p):
+    return stats.norm.ppf(p)
+
+
+def _z(p):
+    # only scalars can be cached, array-like probabilities (ex: a grid of alphas) are computed directly.
+    if np.ndim(p) == 0:
+        return _cached_z(float(p))
+    return stats.norm.ppf(p)
+
+
 def sample_size_necessary_under_cph(power, ratio_of_participants, p_exp, p_con, postulated_hazard_ratio, alpha=0.05):
     """
     This computes the sample size for needed power to compare two groups under a Cox
@@ -272,14 +288,13 @@ def sample_size_necessary_under_cph(power, ratio_of_participants, p_exp, p_con,
     power_under_cph
     """
 
-    def z(p):
-        return stats.norm.ppf(p)
+    zsum = _z(1.0 - alpha / 2.0) + _z(power)
 
     m = (
         1.0
         / ratio_of_participants
         * ((ratio_of_participants * postulated_hazard_ratio + 1.0) / (postulated_hazard_ratio - 1.0)) ** 2
-        * (z(1.0 - alpha / 2.0) + z(power)) ** 2
+        * zsum ** 2
     )
 
     n_exp = m * ratio_of_participants / (ratio_of_participants * p_exp + p_con)
@@ -331,13 +346,10 @@ def power_under_cph(n_exp, n_con, p_exp, p_con, postulated_hazard_ratio, alpha=0
     sample_size_necessary_under_cph
     """
 
-    def z(p):
-        return stats.norm.ppf(p)
-
     m = n_exp * p_exp + n_con * p_con
     k = float(n_exp) / float(n_con)
     return stats.norm.cdf(
-        np.sqrt(k * m) * abs(postulated_hazard_ratio - 1) / (k * postulated_hazard_ratio + 1) - z(1 - alpha / 2.0)
+        np.sqrt(k * m) * abs(postulated_hazard_ratio - 1) / (k * postulated_hazard_ratio + 1) - _z(1 - alpha / 2.0)
     )
 
 
@@ -584,7 +596,7 @@ def logrank_test(
 
 
 def pairwise_logrank_test(
-    event_durations, groups, event_observed=None, t_0=-1, weightings=None, **kwargs
+    event_durations, groups, event_observed=None, t_0=-1, weightings=None, correction=None, **kwargs
 ) -> StatisticalResult:  # pylint: disable=too-many-locals
 
     r"""
@@ -621,6 +633,15 @@ def pairwise_logrank_test(
             where :math:`n_i` is the number at risk just prior to time :math:`t_{i}`, :math:`\bar{S}(t_i)` is
             Peto-Peto's modified survival estimate and :math:`\hat{S}(t_i)` is the left-continuous
             Kaplan-Meier survival estimate at time :math:`t_{i}`.
+
+    correction: str, optional
+        adjust the p-values for the multiple comparisons: options are "bonferroni", "holm" for Holm's step-down
+        procedure, and "rank_adjustment" for a rank-adjusted step-up procedure (Benjamini & Yekutieli), which
+        scales the :math:`k`-th smallest of :math:`m` p-values by :math:`m (1 + 1/2 + ... + 1/m) / k`. The first two
+        control the family-wise error rate. The latter controls the false discovery rate (and hence the family-wise
+        error rate when there are no differences between groups) under any dependence between the tests, and is less
+        conservative when there are many groups. Default is no adjustment.
+
     kwargs:
         add keywords and meta-data to the experiment summary.
 
@@ -638,39 +659,261 @@ def pairwise_logrank_test(
     logrank_test
     """
 
-    if event_observed is None:
-        event_observed = np.ones((event_durations.shape[0], 1))
+    kwargs.setdefault("test_name", "logrank_test")
 
-    n = np.max(np.asarray(event_durations).shape)
+    event_durations = np.ravel(np.asarray(event_durations))
+    n = event_durations.size
+    groups = np.ravel(np.asarray(groups))
 
-    groups, event_durations, event_observed = map(lambda x: np.asarray(x).reshape(n), [groups, event_durations, event_observed])
+    if event_observed is None:
+        event_observed = np.ones(n)
+    else:
+        event_observed = np.ravel(np.asarray(event_observed))
 
-    if not (n == event_durations.shape[0] == event_observed.shape[0]):
+    if not (n == groups.size == event_observed.size):
         raise ValueError("inputs must be of the same length.")
 
-    groups, event_durations, event_observed = pd.Series(groups), pd.Series(event_durations), pd.Series(event_observed)
+    event_observed = _censor_after_t_0(event_durations, event_observed, t_0)
 
-    unique_groups = np.unique(groups)
+    # bin the counts once, and compute every pair from them.
+    unique_groups, removed, observed = _group_event_counts(event_durations, groups, event_observed, sort_groups=True)
 
-    n_unique_groups = unique_groups.shape[0]
+    ix1, ix2 = np.triu_indices(unique_groups.shape[0], 1)
+    U, weightings_name = _pairwise_logrank_statistics(removed, observed, ix1, ix2, weightings, **kwargs)
+    kwargs["test_name"] = kwargs["test_name"].replace("logrank", weightings_name)
 
-    result = StatisticalResult([], [], [], test_name="pairwise_logrank_test")
+    p_values = _chisq_test_p_value(U, 1)
+    if correction is not None:
+        p_values = _adjust_p_values(p_values, correction)
+        kwargs["correction"] = correction
 
-    for i1, i2 in combinations(np.arange(n_unique_groups), 2):
-        g1, g2 = unique_groups[[i1, i2]]
-        ix1, ix2 = (groups == g1), (groups == g2)
-        result += logrank_test(
-            event_durations.loc[ix1],
-            event_durations.loc[ix2],
-            event_observed.loc[ix1],
-            event_observed.loc[ix2],
-            t_0=t_0,
-            name=[(g1, g2)],
-            weightings=weightings,
-            **kwargs
+    return StatisticalResult(
+        p_values,
+        U,
+        name=list(zip(unique_groups[ix1], unique_groups[ix2])),
+        t_0=t_0,
+        null_distribution="chi squared",
+        degrees_of_freedom=1,
+        **kwargs
+    )
+
+
+def _pairwise_logrank_statistics(removed, observed, ix1, ix2, weightings, **kwargs):
+    """
+    Computes the (weighted) logrank test statistic between the groups ``ix1[k]`` and ``ix2[k]``, for every k, from the
+    binned counts of ``_group_event_counts``. Returns the test statistics and the name of the test.
+    """
+    n_ij = removed.sum(0) - _exclusive_cumsum(removed)
+
+    if _pairwise_Z_and_V is not None and len(ix1) > 1:
+        # a single pass over the times for each pair, in parallel, rather than (n_times, n_pairs) temporaries.
+        weightings_name = _logrank_weightings_name(weightings, **kwargs)
+        Z, V = _pairwise_Z_and_V(
+            np.ascontiguousarray(n_ij, dtype=float),
+            np.ascontiguousarray(observed, dtype=float),
+            np.asarray(ix1, dtype=np.int64),
+            np.asarray(ix2, dtype=np.int64),
+            list(_LOGRANK_WEIGHTINGS).index(weightings),
+            float(kwargs.get("p", 0)),
+            float(kwargs.get("q", 0)),
         )
+    else:
+        Z, V, weightings_name = _pairwise_Z_and_V_numpy(n_ij, observed, ix1, ix2, weightings, **kwargs)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        U = np.where(V > 0, Z ** 2 / V, 0.0)  # agrees with the pseudo-inverse used in multivariate_logrank_test
+    return U, weightings_name
+
+
+def _pairwise_Z_and_V_numpy(n_ij, observed, ix1, ix2, weightings, **kwargs):
+    # at-risk and deaths of each pair, shape (n_times, n_pairs)
+    n_a, n_b = n_ij[:, ix1], n_ij[:, ix2]
+    d_a = observed[:, ix1]
+    n_i = n_a + n_b
+    d_i = d_a + observed[:, ix2]
+
+    w_i, weightings_name = _logrank_weights(weightings, n_i, d_i, **kwargs)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ev_a = np.where(n_i > 0, n_a * d_i / n_i, 0)
+        ratio = np.nan_to_num((n_i - d_i) / (n_i - 1), nan=1, posinf=1, neginf=1)
+        ratio = np.clip(ratio, 0, None)  # possible with case weights, when less than one subject is at risk
+        factor = ratio * d_i / n_i ** 2
+    factor[n_i == 0] = 0
+
+    Z = (w_i * (d_a - ev_a)).sum(0)
+    V = (w_i ** 2 * factor * n_a * n_b).sum(0)
+    return Z, V, weightings_name
+
+
+def _adjust_p_values(p_values, correction):
+    """
+    Adjusts p-values for multiple comparisons. See ``pairwise_logrank_test`` for the available corrections.
+    """
+    p_values = np.asarray(p_values, dtype=float)
+    m = p_values.shape[0]
+
+    if correction == "bonferroni":
+        return np.minimum(m * p_values, 1.0)
+
+    order = np.argsort(p_values)
+    rank = np.arange(1, m + 1)
+    adjusted = np.empty(m)
+
+    if correction == "holm":
+        # step-down: the k-th smallest is compared against alpha / (m - k + 1)
+        adjusted[order] = np.maximum.accumulate((m - rank + 1) * p_values[order])
+    elif correction == "rank_adjustment":
+        # step-up: the k-th smallest is compared against k * alpha / (m * c_m), with c_m ~ 1 + log(m)
+        c_m = (1.0 / rank).sum()
+        adjusted[order] = np.minimum.accumulate((m * c_m / rank * p_values[order])[::-1])[::-1]
+    else:
+        raise ValueError("Invalid value for correction.")
+
+    return np.minimum(adjusted, 1.0)
 
-    return result
+
+class LogrankCutoffScanner:
+    r"""
+    Performs the logrank test between the groups :math:`x \le c` and :math:`x > c`, for many cutoffs :math:`c` of a
+    covariate :math:`x`. This is useful when searching for an optimal cutoff of a continuous covariate.
+
+    The durations and events are sorted once, and the quantities that don't depend on the split (the number at risk, the
+    deaths and the weightings, all pooled over both groups) are precomputed. Each call to ``scan`` then computes the
+    test statistics of all cutoffs at once, instead of rebuilding the survival table for each cutoff as repeated calls
+    to ``logrank_test`` would.
+
+    Parameters
+    ----------
+
+    durations: iterable
+        a (n,) list-like representing the (possibly partial) durations of all individuals
+
+    event_observed: iterable, optional
+        a (n,) list-like of event_observed events: 1 if observed death, 0 if censored. Defaults to all observed.
+
+    t_0: float, optional (default=-1)
+        The final time period under observation, and subjects who experience the event after this time are set to be censored.
+        Specify -1 to use all time.
+
+    weightings: str, optional
+        apply a weighted logrank test. See ``logrank_test`` for the options.
+
+    kwargs:
+        add keywords and meta-data to the experiment summary. For the Fleming-Harrington test, the keyword
+        arguments p and q.
+
+    Examples
+    --------
+    .. code:: python
+
+        from lifelines.statistics import LogrankCutoffScanner
+        from lifelines.datasets import load_rossi
+
+        rossi = load_rossi()
+        scanner = LogrankCutoffScanner(rossi["week"], rossi["arrest"])
+
+        results = scanner.scan(rossi["age"], [20, 22, 25, 30, 35])
+        results.print_summary()
+
+    Note
+    -----
+    The multiple testing inherent in searching over many cutoffs is not corrected for.
+
+    See Also
+    --------
+    logrank_test
+    """
+
+    def __init__(self, durations, event_observed=None, t_0=-1, weightings=None, **kwargs):
+        durations = np.ravel(np.asarray(durations))
+        if event_observed is None:
+            event_observed = np.ones(durations.shape[0])
+        event_observed = np.ravel(np.asarray(event_observed))
+
+        if durations.shape[0] != event_observed.shape[0]:
+            raise ValueError("inputs must be of the same length.")
+
+        event_observed = _censor_after_t_0(durations, event_observed, t_0)
+
+        times, time_ix = np.unique(durations, return_inverse=True)
+        n_times = times.shape[0]
+        self._time_ix = time_ix.ravel()
+        self._event_observed = event_observed.astype(bool)
+
+        removed = np.bincount(self._time_ix, minlength=n_times).astype(float)
+        d_i = np.bincount(self._time_ix, weights=self._event_observed, minlength=n_times)
+        n_i = removed.sum() - _exclusive_cumsum(removed)
+
+        w_i, weightings_name = _logrank_weights(weightings, n_i, d_i, **kwargs)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.nan_to_num((n_i - d_i) / (n_i - 1), nan=1, posinf=1, neginf=1)
+            self._factor = w_i ** 2 * ratio * d_i / n_i ** 2
+        self._hazard = d_i / n_i
+        self._w_i = w_i
+        self._n_i = n_i
+
+        self.t_0 = t_0
+        self.test_name = "logrank_test".replace("logrank", weightings_name)
+        self._kwargs = kwargs
+
+    def scan(self, x, cutoffs, **kwargs) -> StatisticalResult:
+        """
+        Parameters
+        ----------
+        x: iterable
+            a (n,) list-like of the covariate to split on, for the same individuals as ``durations``.
+        cutoffs: iterable
+            the cutoffs to test. Each splits the individuals into the groups ``x <= cutoff`` and ``x > cutoff``.
+        kwargs:
+            add keywords and meta-data to the experiment summary.
+
+        Returns
+        -------
+        StatisticalResult
+            a StatisticalResult object with a result for each cutoff. Cutoffs that leave a group empty have a NaN test statistic.
+        """
+        x = np.ravel(np.asarray(x))
+        if x.shape[0] != self._time_ix.shape[0]:
+            raise ValueError("x must be the same length as durations.")
+
+        cutoffs = np.ravel(np.asarray(cutoffs))
+        order = np.argsort(cutoffs, kind="stable")
+        n_cutoffs = cutoffs.shape[0]
+
+        # subjects in bin k have cutoffs[k-1] < x <= cutoffs[k], so the group x <= cutoffs[k] is bins 0, ..., k.
+        bins = np.searchsorted(cutoffs[order], x, side="left")
+        removed = np.zeros((self._n_i.shape[0], n_cutoffs + 1))
+        observed = np.zeros((self._n_i.shape[0], n_cutoffs + 1))
+        np.add.at(removed, (self._time_ix, bins), 1)
+        np.add.at(observed, (self._time_ix, bins), self._event_observed)
+        removed = removed.cumsum(1)[:, :-1]
+        observed = observed.cumsum(1)[:, :-1]
+
+        # at-risk in the x <= cutoff group, shape (n_times, n_cutoffs)
+        n_1 = removed.sum(0) - _exclusive_cumsum(removed)
+
+        Z = (self._w_i[:, None] * (observed - n_1 * self._hazard[:, None])).sum(0)
+        V = (self._factor[:, None] * n_1 * (self._n_i[:, None] - n_1)).sum(0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            U = np.where(V > 0, Z ** 2 / V, 0.0)
+        U[(n_1[0] == 0) | (n_1[0] == self._n_i[0])] = np.nan
+
+        test_statistics = np.empty(n_cutoffs)
+        test_statistics[order] = U
+        p_values = _chisq_test_p_value(test_statistics, 1)
+
+        return StatisticalResult(
+            p_values,
+            test_statistics,
+            name=cutoffs.tolist(),
+            test_name=self.test_name,
+            t_0=self.t_0,
+            null_distribution="chi squared",
+            degrees_of_freedom=1,
+            **{**self._kwargs, **kwargs}
+        )
 
 
 def difference_of_restricted_mean_survival_time_test(model1, model2, t):
@@ -767,45 +1010,122 @@ def multivariate_logrank_test(
     """
     kwargs.setdefault("test_name", "multivariate_logrank_test")
 
-    event_durations, groups = np.asarray(event_durations), np.asarray(groups)
+    event_durations = np.ravel(np.asarray(event_durations))
+    n = event_durations.size
+
+    groups = np.ravel(np.asarray(groups))
+    assert groups.size == n, "inputs must be of the same length."
 
     if event_observed is None:
-        event_observed = np.ones((event_durations.shape[0], 1))
+        event_observed = np.ones(n)
     else:
-        event_observed = np.asarray(event_observed)
-
-    n = np.max(event_durations.shape)
-    assert n == np.max(event_durations.shape) == np.max(event_observed.shape), "inputs must be of the same length."
-    groups, event_durations, event_observed = map(
-        lambda x: pd.Series(np.asarray(x).reshape(n)), [groups, event_durations, event_observed]
-    )
+        event_observed = np.ravel(np.asarray(event_observed))
+        assert event_observed.size == n, "inputs must be of the same length."
 
-    # censor all subjects that are beyond the specified t_0, see #1300
-    if int(t_0) != -1:
-        event_observed[event_durations > t_0] = 0
+    event_observed = _censor_after_t_0(event_durations, event_observed, t_0)
 
-    unique_groups, rm, obs, _ = group_survival_table_from_events(groups, event_durations, event_observed, weights=weights)
+    unique_groups, removed, observed = _group_event_counts(event_durations, groups, event_observed, weights)
     n_groups = unique_groups.shape[0]
 
-    # compute the factors needed
-    n_ij = rm.sum(0).values - rm.cumsum(0).shift(1).fillna(0)
-    d_i = obs.sum(1)
-    n_i = rm.values.sum() - rm.sum(1).cumsum().shift(1).fillna(0)
-    ev_i = n_ij.mul(d_i / n_i, axis="index")
+    if n_groups == 2:
+        # the statistic reduces to the scalar Z^2 / V, so skip the covariance matrix and its inverse.
+        U, weightings_name = _pairwise_logrank_statistics(removed, observed, [0], [1], weightings, **kwargs)
+        U = U[0]
+        kwargs["test_name"] = kwargs["test_name"].replace("logrank", weightings_name)
 
-    # compute weightings for log-rank alternatives
-    if weightings is None:
-        w_i = np.ones(d_i.shape[0])
-    elif weightings == "wilcoxon":
-        kwargs["test_name"] = kwargs["test_name"].replace("logrank", "Wilcoxon")
-        w_i = n_i
-    elif weightings == "tarone-ware":
-        kwargs["test_name"] = kwargs["test_name"].replace("logrank", "Tarone-Ware")
-        w_i = np.sqrt(n_i)
-    elif weightings == "peto":
-        kwargs["test_name"] = kwargs["test_name"].replace("logrank", "Peto")
-        w_i = np.cumprod(1.0 - (ev_i.sum(1)) / (n_i + 1))  # Peto-Peto's modified survival estimates.
-    elif weightings == "fleming-harrington":
+    else:
+        # compute the factors needed
+        d_i = observed.sum(1)
+        n_i = removed.sum() - _exclusive_cumsum(removed.sum(1))
+
+        # compute weightings for log-rank alternatives
+        w_i, weightings_name = _logrank_weights(weightings, n_i, d_i, **kwargs)
+        kwargs["test_name"] = kwargs["test_name"].replace("logrank", weightings_name)
+
+        # vector of (weighted) observed minus expected, and its covariance matrix
+        Z_j, V = _compute_Z_and_V(removed, observed, w_i)
+
+        if __debug__ and _VALIDATE:
+            assert abs(Z_j.sum()) < 10e-8, "Sum is not zero."
+
+        # take the first n-1 groups. V is symmetric positive semi-definite, so try a Cholesky solve before the pseudo-inverse.
+        Z_j, V = Z_j[:-1], V[:-1, :-1]
+        try:
+            U = Z_j @ cho_solve(cho_factor(V, lower=True), Z_j)  # Z.T*inv(V)*Z
+        except LinAlgError:
+            U = Z_j @ np.linalg.pinv(V) @ Z_j
+
+    # compute the p-values and tests
+    p_value = _chisq_test_p_value(U, n_groups - 1)
+    return StatisticalResult(p_value, U, t_0=t_0, null_distribution="chi squared", degrees_of_freedom=n_groups - 1, **kwargs)
+
+
+def _censor_after_t_0(event_durations, event_observed, t_0):
+    """
+    Censors all subjects that are beyond the specified t_0, see #1300. Returns a new array rather than modifying the input.
+    """
+    if int(t_0) == -1:
+        return event_observed
+    return np.where(event_durations > t_0, 0, event_observed)
+
+
+def _group_event_counts(event_durations, groups, event_observed, weights=None, sort_groups=False):
+    """
+    Bins the (weighted) number removed and number of observed deaths by unique time and by group. This is a numpy-only
+    version of ``group_survival_table_from_events``.
+
+    Returns
+    -------
+    unique_groups: (G,) array
+        the unique groups, in order of appearance unless ``sort_groups`` is True (which requires orderable labels)
+    removed: (T, G) array
+        the number removed (death or censored) at each sorted unique time, for each group
+    observed: (T, G) array
+        the number of observed deaths at each sorted unique time, for each group
+    """
+    # factorize rather than np.unique, as it doesn't need orderable labels (ex: mixed types)
+    group_ix, unique_groups = pd.factorize(np.ravel(groups), sort=sort_groups)
+    event_durations, event_observed = np.ravel(event_durations), np.ravel(event_observed)
+    if weights is None:
+        weights = np.ones(group_ix.shape[0])
+    weights = np.asarray(weights, dtype=float).reshape(group_ix.shape[0])
+
+    # as with the groupby in group_survival_table_from_events, subjects with a missing group label are left out.
+    if (group_ix < 0).any():
+        keep = group_ix >= 0
+        group_ix, event_durations, event_observed, weights = (
+            group_ix[keep],
+            event_durations[keep],
+            event_observed[keep],
+            weights[keep],
+        )
+
+    times, time_ix = np.unique(event_durations, return_inverse=True)
+
+    removed = np.zeros((times.shape[0], unique_groups.shape[0]))
+    observed = np.zeros((times.shape[0], unique_groups.shape[0]))
+    np.add.at(removed, (time_ix, group_ix), weights)
+    np.add.at(observed, (time_ix, group_ix), weights * event_observed.astype(bool))
+    return unique_groups, removed, observed
+
+
+# the weighted logrank tests, and their names. The order is also the code used by the numba kernels.
+_LOGRANK_WEIGHTINGS = {
+    None: "logrank",
+    "wilcoxon": "Wilcoxon",
+    "tarone-ware": "Tarone-Ware",
+    "peto": "Peto",
+    "fleming-harrington": "Flemington-Harrington",
+}
+
+
+def _logrank_weightings_name(weightings, **kwargs):
+    """
+    Validates the weightings (and for Fleming-Harrington, the keyword arguments p and q) and returns the name of the test.
+    """
+    if weightings not in _LOGRANK_WEIGHTINGS:
+        raise ValueError("Invalid value for weightings.")
+    if weightings == "fleming-harrington":
         if "p" in kwargs:
             p = kwargs["p"]
             if p < 0:
@@ -818,40 +1138,38 @@ def multivariate_logrank_test(
                 raise ValueError("q must be non-negative.")
         else:
             raise ValueError("Must provide keyword argument q for Flemington-Harrington test statistic")
-        kwargs["test_name"] = kwargs["test_name"].replace("logrank", "Flemington-Harrington")
-        kmf = KaplanMeierFitter().fit(event_durations, event_observed=event_observed)
-        s = kmf.survival_function_.to_numpy().flatten()[:-1]  # Left-continuous Kaplan-Meier survival estimate.
-        w_i = np.power(s, p) * np.power(1.0 - s, q)
-    else:
-        raise ValueError("Invalid value for weightings.")
+    return _LOGRANK_WEIGHTINGS[weightings]
 
-    # apply weights to observed and expected
-    N_j = obs.mul(w_i, axis=0).sum(0).values
-    ev = ev_i.mul(w_i, axis=0).sum(0)
 
-    # vector of observed minus expected
-    Z_j = N_j - ev
-
-    assert abs(Z_j.sum()) < 10e-8, "Sum is not zero."  # this should move to a test eventually.
-
-    # compute covariance matrix
-    factor = (((n_i - d_i) / (n_i - 1)).replace([np.inf, np.nan], 1)) * d_i / n_i ** 2
-    n_ij["_"] = n_i.values
-    V_ = (n_ij.mul(w_i, axis=0)).mul(np.sqrt(factor), axis="index").fillna(0)  # weighted V_
-    V = -np.dot(V_.T, V_)
-    ix = np.arange(n_groups)
-    V[ix, ix] = V[ix, ix] - V[-1, ix]
-    V = V[:-1, :-1]
+def _logrank_weights(weightings, n_i, d_i, **kwargs):
+    """
+    Computes the weights applied at each ordered time in the (weighted) logrank tests. ``n_i`` and ``d_i`` are
+    the number at risk and number of deaths, with time along the first axis. Returns the weights and the name of the test.
+    """
+    weightings_name = _logrank_weightings_name(weightings, **kwargs)
 
-    # take the first n-1 groups
-    U = Z_j.iloc[:-1] @ np.linalg.pinv(V[:-1, :-1]) @ Z_j.iloc[:-1]  # Z.T*inv(V)*Z
+    if weightings is None:
+        w_i = np.ones_like(n_i, dtype=float)
+    elif weightings == "wilcoxon":
+        w_i = n_i
+    elif weightings == "tarone-ware":
+        w_i = np.sqrt(n_i)
+    elif weightings == "peto":
+        w_i = np.cumprod(1.0 - d_i / (n_i + 1), axis=0)  # Peto-Peto's modified survival estimates.
+    elif weightings == "fleming-harrington":
+        # Left-continuous Kaplan-Meier survival estimate.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            s = np.cumprod(1.0 - np.where(n_i > 0, d_i / n_i, 0), axis=0)
+        s = np.concatenate([np.ones_like(s[:1]), s[:-1]])
+        w_i = np.power(s, kwargs["p"]) * np.power(1.0 - s, kwargs["q"])
 
-    # compute the p-values and tests
-    p_value = _chisq_test_p_value(U, n_groups - 1)
-    return StatisticalResult(p_value, U, t_0=t_0, null_distribution="chi squared", degrees_of_freedom=n_groups - 1, **kwargs)
+    return w_i, weightings_name
 
 
 def _chisq_test_p_value(U, degrees_freedom) -> float:
+    if degrees_freedom == 1:
+        # closed form, skipping the scipy.stats distribution machinery: P(Z^2 > U) = erfc(sqrt(U / 2)).
+        return special.erfc(np.sqrt(np.maximum(np.asarray(U, dtype=float), 0) * 0.5))
     p_value = stats.chi2.sf(U, degrees_freedom)
     return p_value
 
@@ -921,9 +1239,9 @@ def proportional_hazard_test(
         scaled_resids = precomputed_residuals
 
     def compute_statistic(times, resids, n_deaths):
-        demeaned_times = times - times.mean()
-        T = (demeaned_times.values[:, None] * resids.values).sum(0) ** 2 / (
-            n_deaths * (fitted_cox_model.standard_errors_ ** 2) * (demeaned_times ** 2).sum()
+        demeaned_times = np.asarray(times - times.mean())
+        T = (demeaned_times @ resids.values) ** 2 / (
+            n_deaths * (fitted_cox_model.standard_errors_.values ** 2) * (demeaned_times @ demeaned_times)
         )
         return T
 
@@ -932,23 +1250,24 @@ def proportional_hazard_test(
 
     if isinstance(time_transform, list):
 
-        result = StatisticalResult([], [], [])
-
-        # yuck
-        for transform_name, transform in ((_, TimeTransformers().get(_)) for _ in time_transform):
-            times = transform(durations, events, weights)[events.values]
-            T = compute_statistic(times, scaled_resids, n_deaths)
-            p_values = utils._to_1d_array([_chisq_test_p_value(t, 1) for t in T])
-            result += StatisticalResult(
-                p_values,
-                T,
-                name=[(c, transform_name) for c in fitted_cox_model.params_.index],
-                test_name="proportional_hazard_test",
-                null_distribution="chi squared",
-                degrees_of_freedom=1,
-                model=str(fitted_cox_model),
-                **kwargs
-            )
+        Ts = []
+        for transform_name in time_transform:
+            times = TimeTransformers().get(transform_name)(durations, events, weights)[events.values]
+            Ts.append(compute_statistic(times, scaled_resids, n_deaths))
+
+        # compute the p-values of all transforms at once
+        T = np.concatenate(Ts)
+        p_values = _chisq_test_p_value(T, 1)
+        result = StatisticalResult(
+            p_values,
+            T,
+            name=[(c, transform_name) for transform_name in time_transform for c in fitted_cox_model.params_.index],
+            test_name="proportional_hazard_test",
+            null_distribution="chi squared",
+            degrees_of_freedom=1,
+            model=str(fitted_cox_model),
+            **kwargs
+        )
 
     else:
         time_transformer = TimeTransformers().get(time_transform)
@@ -958,9 +1277,11 @@ def proportional_hazard_test(
 
         times = time_transformer(durations, events, weights)[events.values]
 
-        T = compute_statistic(times, scaled_resids, n_deaths)
+        # keep the statistics indexed by covariate, as the standard errors are
+        standard_errors = fitted_cox_model.standard_errors_
+        T = pd.Series(compute_statistic(times, scaled_resids, n_deaths), index=standard_errors.index, name=standard_errors.name)
 
-        p_values = utils._to_1d_array([_chisq_test_p_value(t, 1) for t in T])
+        p_values = _chisq_test_p_value(T, 1)
         result = StatisticalResult(
             p_values,
             T,
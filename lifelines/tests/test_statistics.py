@@ -8,7 +8,7 @@ from pandas.testing import assert_frame_equal
 from lifelines import statistics as stats
 from lifelines import CoxPHFitter, KaplanMeierFitter, WeibullFitter
 from lifelines.exceptions import StatisticalWarning
-from lifelines.datasets import load_waltons, load_g3, load_lymphoma, load_dd, load_regression_dataset, load_leukemia
+from lifelines.datasets import load_waltons, load_g3, load_lymphoma, load_dd, load_regression_dataset, load_leukemia, load_rossi
 
 
 def test_sample_size_necessary_under_cph():
@@ -21,6 +21,7 @@ def test_sample_size_necessary_under_cph():
 def test_power_under_cph():
     assert abs(stats.power_under_cph(12, 12, 0.8, 0.2, 0.139) - 0.744937) < 10e-6
     assert abs(stats.power_under_cph(12, 20, 0.8, 0.2, 1.2) - 0.05178317) < 10e-6
+    npt.assert_allclose(stats.power_under_cph(12, 12, 0.8, 0.2, 0.139, alpha=np.array([0.05])), [0.744937], rtol=1e-5)
 
 
 def test_unequal_intensity_with_random_data():
@@ -227,6 +228,14 @@ def test_logrank_test_is_symmetric():
     assert abs(result1.p_value - result2.p_value) < 10e-8
 
 
+def test_multivariate_logrank_test_with_t_0_does_not_modify_inputs():
+    T = np.random.exponential(5, size=100)
+    E = np.ones(100)
+    G = np.random.binomial(2, 0.5, size=100)
+    stats.multivariate_logrank_test(T, G, E, t_0=3)
+    assert E.sum() == 100
+
+
 def test_multivariate_unequal_intensities():
     T = np.random.exponential(10, size=300)
     g = np.random.binomial(2, 0.5, size=300)
@@ -252,6 +261,71 @@ def test_pairwise_allows_dataframes_and_gives_correct_counts():
     assert R.summary.shape[0] == N_groups * (N_groups - 1) / 2
 
 
+@pytest.mark.parametrize("weightings", [None, "wilcoxon", "tarone-ware", "peto", "fleming-harrington"])
+def test_pairwise_logrank_test_is_identical_to_logrank_test_on_each_pair(weightings):
+    N = 300
+    T = np.random.exponential(5, size=N).round(1) + 0.1
+    C = np.random.binomial(1, 0.7, size=N)
+    G = np.random.choice(["a", "b", "c", "d"], size=N)
+
+    R = stats.pairwise_logrank_test(T, G, C, t_0=8, weightings=weightings, p=1, q=1)
+    for (g1, g2), test_statistic, p_value in zip(R.name, R._test_statistic, R._p_value):
+        ix1, ix2 = G == g1, G == g2
+        result = stats.logrank_test(T[ix1], T[ix2], C[ix1], C[ix2], t_0=8, weightings=weightings, p=1, q=1)
+        npt.assert_allclose(test_statistic, result.test_statistic, rtol=1e-8)
+        npt.assert_allclose(p_value, result.p_value, rtol=1e-8)
+
+
+def test_pairwise_logrank_test_corrections():
+    N = 400
+    T = np.random.exponential(5, size=N)
+    G = np.random.choice(["a", "b", "c", "d", "e"], size=N)
+    T[G == "a"] = np.random.exponential(1, size=(G == "a").sum())
+
+    raw = stats.pairwise_logrank_test(T, G)._p_value
+    m = raw.shape[0]
+    order = np.argsort(raw)
+
+    bonferroni = stats.pairwise_logrank_test(T, G, correction="bonferroni")
+    npt.assert_allclose(bonferroni._p_value, np.minimum(m * raw, 1))
+    assert bonferroni.correction == "bonferroni"
+
+    holm = stats.pairwise_logrank_test(T, G, correction="holm")._p_value
+    expected = np.minimum(np.maximum.accumulate((m - np.arange(m)) * raw[order]), 1)
+    npt.assert_allclose(holm[order], expected)
+    assert (raw <= holm).all() and (holm <= bonferroni._p_value).all()
+
+    rank_adjusted = stats.pairwise_logrank_test(T, G, correction="rank_adjustment")._p_value
+    assert (raw <= rank_adjusted).all()
+    assert (np.diff(rank_adjusted[order]) >= 0).all()
+
+    with pytest.raises(ValueError):
+        stats.pairwise_logrank_test(T, G, correction="not-a-correction")
+
+
+@pytest.mark.parametrize("weightings", [None, "wilcoxon", "peto"])
+def test_logrank_cutoff_scanner_is_identical_to_logrank_test_at_each_cutoff(weightings):
+    rossi = load_rossi()
+    T, E, x = rossi["week"], rossi["arrest"], rossi["age"]
+    cutoffs = [30, 20, 22.5, 25, 35]
+
+    scanner = stats.LogrankCutoffScanner(T, E, t_0=40, weightings=weightings)
+    results = scanner.scan(x, cutoffs)
+    assert results.name == cutoffs
+
+    for cutoff, test_statistic, p_value in zip(cutoffs, results._test_statistic, results._p_value):
+        ix = x <= cutoff
+        result = stats.logrank_test(T[ix], T[~ix], E[ix], E[~ix], t_0=40, weightings=weightings)
+        npt.assert_allclose(test_statistic, result.test_statistic, rtol=1e-8)
+        npt.assert_allclose(p_value, result.p_value, rtol=1e-8)
+
+
+def test_logrank_cutoff_scanner_with_empty_group():
+    rossi = load_rossi()
+    results = stats.LogrankCutoffScanner(rossi["week"], rossi["arrest"]).scan(rossi["age"], [0, 100])
+    assert np.isnan(results._test_statistic).all()
+
+
 def test_log_rank_returns_None_if_equal_arrays():
     T = np.random.exponential(5, size=200)
     result = stats.logrank_test(T, T)
@@ -277,6 +351,107 @@ def test_multivariate_log_rank_is_identital_to_log_rank_for_n_equals_2():
     assert result.p_value == result_m.p_value
 
 
+def test_logrank_Z_and_V():
+    from lifelines._logrank_numba import _compute_Z_and_V
+
+    removed = np.random.uniform(0.5, 2, size=(50, 4)) * np.random.binomial(1, 0.5, size=(50, 4))
+    removed[-1] = 0  # no one at risk at the last time
+    observed = removed * np.random.binomial(1, 0.7, size=(50, 4))
+    weights = np.random.uniform(size=50)
+
+    Z, V = _compute_Z_and_V(removed, observed, weights)
+    assert np.isfinite(Z).all() and np.isfinite(V).all()
+    assert abs(Z.sum()) < 10e-8
+    npt.assert_allclose(V, V.T)
+    npt.assert_allclose(V.sum(1), 0, atol=10e-8)
+
+    # with two groups, it reduces to the two-sample statistics
+    n_ij = removed[:, :2].sum(0) - np.r_[np.zeros((1, 2)), removed[:-1, :2].cumsum(0)]
+    Z_pair, V_pair, _ = stats._pairwise_Z_and_V_numpy(n_ij, observed[:, :2], [0], [1], None)
+    Z, V = _compute_Z_and_V(removed[:, :2], observed[:, :2], np.ones(50))
+    npt.assert_allclose(Z[0], Z_pair[0])
+    npt.assert_allclose(V[0, 0], V_pair[0])
+
+
+def test_multivariate_logrank_accepts_unorderable_and_missing_group_labels():
+    T = np.random.exponential(10, size=60)
+    E = np.random.binomial(1, 0.7, size=60)
+
+    mixed = stats.multivariate_logrank_test(T, np.array(["a", 1, "b"] * 20, dtype=object), E)
+    expected = stats.multivariate_logrank_test(T, np.array(["a", "c", "b"] * 20), E)
+    assert abs(mixed.test_statistic - expected.test_statistic) < 10e-8
+
+    # subjects with a missing label are left out
+    g = np.array([None, "x", "y"] * 20, dtype=object)
+    missing = stats.multivariate_logrank_test(T, g, E)
+    expected = stats.multivariate_logrank_test(T[g != None], g[g != None], E[g != None])
+    assert abs(missing.test_statistic - expected.test_statistic) < 10e-8
+
+
+def test_multivariate_logrank_with_a_group_censored_before_the_first_death(monkeypatch):
+    # the group contributes nothing, so the covariance matrix is singular and the pseudo-inverse is used.
+    calls = []
+    pinv = np.linalg.pinv
+    monkeypatch.setattr(np.linalg, "pinv", lambda V: calls.append(V) or pinv(V))
+
+    T_b = 1 + np.random.exponential(10, size=50)
+    T_c = 1 + np.random.exponential(5, size=50)
+    E_b = np.random.binomial(1, 0.7, size=50)
+    E_c = np.random.binomial(1, 0.7, size=50)
+
+    T = np.r_[np.random.uniform(0, 0.5, size=10), T_b, T_c]
+    E = np.r_[np.zeros(10), E_b, E_c]
+    g = np.array(["a"] * 10 + ["b"] * 50 + ["c"] * 50)
+
+    result = stats.multivariate_logrank_test(T, g, E)
+    expected = stats.logrank_test(T_b, T_c, E_b, E_c)
+    assert len(calls) == 1
+    assert abs(result.test_statistic - expected.test_statistic) < 10e-8
+
+
+def test_multivariate_logrank_with_no_weight_at_risk_at_the_last_times():
+    T = np.random.exponential(10, size=300)
+    E = np.random.binomial(1, 0.7, size=300)
+    g = np.random.binomial(2, 0.5, size=300)
+    W = np.ones(300)
+    W[np.argsort(T)[-3:]] = 0
+
+    result = stats.multivariate_logrank_test(T, g, E, weights=W, weightings="peto")
+    expected = stats.multivariate_logrank_test(T[W > 0], g[W > 0], E[W > 0], weightings="peto")
+    assert abs(result.test_statistic - expected.test_statistic) < 10e-8
+
+
+@pytest.mark.parametrize("weightings", [None, "wilcoxon", "tarone-ware", "peto", "fleming-harrington"])
+def test_pairwise_logrank_kernels_agree(weightings):
+    from lifelines._logrank_numba import _pairwise_Z_and_V_loop
+
+    n_ij = np.random.uniform(0.5, 2, size=(50, 4))[::-1].cumsum(0)[::-1]
+    observed = np.random.uniform(size=(50, 4)) * np.random.binomial(1, 0.5, size=(50, 4))
+    ix1, ix2 = np.triu_indices(4, 1)
+
+    Z_loop, V_loop = _pairwise_Z_and_V_loop(
+        n_ij, observed, ix1, ix2, list(stats._LOGRANK_WEIGHTINGS).index(weightings), 1.0, 0.5
+    )
+    Z_numpy, V_numpy, _ = stats._pairwise_Z_and_V_numpy(n_ij, observed, ix1, ix2, weightings, p=1.0, q=0.5)
+    npt.assert_allclose(Z_loop, Z_numpy)
+    npt.assert_allclose(V_loop, V_numpy)
+
+
+def test_chisq_test_p_value_with_one_degree_of_freedom_agrees_with_scipy():
+    from scipy.stats import chi2
+
+    U = np.array([-1.0, 0.0, 1e-12, 0.5, 3.84, 50.0, 800.0, np.inf, np.nan])
+    npt.assert_allclose(stats._chisq_test_p_value(U, 1), chi2.sf(U, 1), rtol=1e-10)
+    npt.assert_allclose(stats._chisq_test_p_value(3.84, 1), chi2.sf(3.84, 1), rtol=1e-10)
+
+
+def test_multivariate_logrank_internal_checks_can_be_enabled(monkeypatch):
+    monkeypatch.setattr(stats, "_VALIDATE", True)
+    T = np.random.exponential(10, size=300)
+    g = np.random.binomial(2, 0.5, size=300)
+    stats.multivariate_logrank_test(T, g)
+
+
 def test_StatisticalResult_kwargs():
 
     sr = stats.StatisticalResult(0.05, 5.0, kw="some_value", test_name="test")
@@ -319,6 +494,7 @@ def test_proportional_hazard_test():
     npt.assert_allclose(results.summary.loc["var2"]["test_statistic"], 0.8792998, rtol=1e-3)
     npt.assert_allclose(results.summary.loc["var3"]["test_statistic"], 2.2686088, rtol=1e-3)
     npt.assert_allclose(results.summary.loc["var3"]["p"], 0.1320184, rtol=1e-3)
+    npt.assert_allclose(results.test_statistic["var1"], 1.4938293, rtol=1e-3)
 
 
 def test_proportional_hazard_test_with_log_transform():
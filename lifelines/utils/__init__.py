@@ -530,7 +530,7 @@ def survival_table_from_events(
     births[entrance] = np.asarray(weights)
     births_table = births.groupby("event_at").sum()
     event_table = death_table.join(births_table, how="outer", sort=True).fillna(0)  # http://wesmckinney.com/blog/?p=414
-    event_table[at_risk] = event_table[entrance].cumsum() - event_table[removed].cumsum().shift(1).fillna(0)
+    event_table[at_risk] = event_table[entrance].cumsum() - _exclusive_cumsum(event_table[removed].values)
 
     # group by intervals
     if (collapse) or (intervals is not None):
@@ -541,6 +541,17 @@ def survival_table_from_events(
     return event_table.astype(int)
 
 
+def _exclusive_cumsum(x) -> np.ndarray:
+    """
+    The cumulative sum, along the first axis, of all elements strictly before each row. Equivalent to
+    ``df.cumsum().shift(1).fillna(0)``, but in a single pass without the intermediate copies.
+    """
+    x = np.asarray(x)
+    out = np.zeros(x.shape, dtype=np.result_type(x.dtype, float))
+    np.cumsum(x[:-1], axis=0, out=out[1:])
+    return out
+
+
 def _group_event_table_by_intervals(event_table, intervals) -> pd.DataFrame:
     event_table = event_table.reset_index()
 
@@ -862,7 +873,7 @@ def _additive_estimate(events, timeline, _additive_f, _additive_var, reverse):
 
     if reverse:
         events = events.sort_index(ascending=False)
-        at_risk = events["entrance"].sum() - events["removed"].cumsum().shift(1).fillna(0)
+        at_risk = events["entrance"].sum() - pd.Series(_exclusive_cumsum(events["removed"].values), index=events.index)
 
         deaths = events["observed"]
 